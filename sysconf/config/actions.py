@@ -55,6 +55,9 @@ class ShellAction(Action):
 
         return self.script == value.script
 
+    def __hash__(self) -> int:
+        return hash(self.script)
+
     def render(self) -> str:
         return self.script
 
@@ -99,6 +99,9 @@ class DomainAction(ABC):
     Base class for all actions that can be performed on a domain.
     """
 
+    # lets slotted subclasses avoid a per instance __dict__
+    __slots__ = ()
+
     def __str__(self) -> str:
         return self.get_description()
 
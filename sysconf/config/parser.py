@@ -1,6 +1,7 @@
 # pyright: strict
 
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from typing import Iterable, Type, cast
 
 from sysconf.config import domain_registry
@@ -85,9 +86,7 @@ class SystemConfigParserV1(SystemConfigParser):
 
         assert isinstance(data, dict)
 
-        # version is not part of the config data
-        data = {k: v for k, v in data.items() if k != 'version'}
-
+        # version is not part of the config data, it is simply not read here
         assert 'config' in data
         user_domains = data.get('domains') or {}
         before_scripts = data.get('before') or []
@@ -166,10 +165,12 @@ class SystemConfigParserV1(SystemConfigParser):
                 case _:
                     raise AssertionError(f'Invalid domain type: {domain_type}')
 
-        domains = {
-            **self.domains_by_key,
-            **user_domains_by_key,
-        }
+        # user domains take precedence, the registry is layered underneath
+        # rather than copied on every parse
+        domains = ChainMap[str, Domain](
+            cast(dict[str, Domain], user_domains_by_key),
+            self.domains_by_key,
+        )
 
         # parse before and after scripts
         before_actions: Iterable[Action] = tuple(
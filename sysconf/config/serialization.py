@@ -7,6 +7,11 @@ from typing import Union
 
 from sysconf.system.file import FileReader
 
+# prefer the LibYAML (C) based loader, PyYAML is not always built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
 
 
 YamlSerializable = Union[
@@ -34,6 +39,7 @@ class YamlDeserializer:
 
         Notes:
         - Performs static interpolations
+        - The raw bytes are passed to the parser, which decodes them itself
 
         Args:
             file_reader (FileReader): The file reader to use.
@@ -43,7 +49,7 @@ class YamlDeserializer:
             YamlSerializable: The deserialized YAML data.
         """
 
-        content: str = file_reader.get_file_contents(path)
+        content: bytes = file_reader.get_file_bytes(path)
         data = self.get_deserialized_data(content)
 
         directory_path = str(path.parent.expanduser().resolve())
@@ -97,8 +103,8 @@ class YamlDeserializer:
 
         return data
 
-    def get_deserialized_data(self, content: str) -> YamlSerializable:
-        yaml_data = yaml.load(content, Loader=yaml.SafeLoader)
+    def get_deserialized_data(self, content: str | bytes) -> YamlSerializable:
+        yaml_data = yaml.load(content, Loader=SafeLoader)
         return yaml_data
 
 class YamlSerializer:
@@ -60,6 +60,9 @@ class SystemConfig:
         self.domains = user_domains
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, SystemConfig):
             return False
 
@@ -128,6 +128,10 @@ class ListConfigEntry(DomainConfigEntry):
             and self.path == value.path \
             and self.value == value.value
 
+    def __hash__(self) -> int:
+        # consistent with __eq__, equal entries always share the same id
+        return hash(self.get_id())
+
     def __repr__(self) -> str:
         return f'ListConfigEntry({self.domain.get_key()}, {self.path}, {self.value})'
 
@@ -1,5 +1,10 @@
 # pyright: strict
 
+import re
+from collections import ChainMap
+from functools import cached_property
+from typing import Mapping
+
 from sysconf.config.domains import DomainAction
 from sysconf.domains.list_domain import ListConfigEntry, ListDomain
 from sysconf.domains.map_domain import MapConfigEntry, MapDomain
@@ -13,18 +18,22 @@ def create_list_shell_domain(
     remove_script: str,
 ) -> ListDomain:
 
+    # templates are compiled once per domain and shared by all its actions
+    add_template = ShellScriptTemplate(add_script)
+    remove_template = ShellScriptTemplate(remove_script)
+
     def add_action_factory(new_entry: ListConfigEntry | MapConfigEntry[str]) -> ShellAddAction:
         return ShellAddAction(
             key,
             new_entry,
-            ShellScriptTemplate(add_script),
+            add_template,
         )
 
     def remove_action_factory(old_entry: ListConfigEntry | MapConfigEntry[str]) -> ShellRemoveAction:
         return ShellRemoveAction(
             key,
             old_entry,
-            ShellScriptTemplate(remove_script),
+            remove_template,
         )
 
     return ListDomain(
@@ -44,11 +53,16 @@ def create_map_shell_domain(
     remove_script: str,
 ) -> MapDomain[str]:
 
+    # templates are compiled once per domain and shared by all its actions
+    add_template = ShellScriptTemplate(add_script)
+    update_template = ShellScriptTemplate(update_script)
+    remove_template = ShellScriptTemplate(remove_script)
+
     def add_action_factory(new_entry: MapConfigEntry[str]) -> ShellAddAction:
         return ShellAddAction(
             key,
             new_entry,
-            ShellScriptTemplate(add_script),
+            add_template,
         )
 
     def update_action_factory(
@@ -59,14 +73,14 @@ def create_map_shell_domain(
             key,
             old_entry,
             new_entry,
-            ShellScriptTemplate(update_script),
+            update_template,
         )
 
     def remove_action_factory(old_entry: MapConfigEntry[str]) -> ShellRemoveAction:
         return ShellRemoveAction(
             key,
             old_entry,
-            ShellScriptTemplate(remove_script),
+            remove_template,
         )
 
     return MapDomain[str](
@@ -81,11 +95,20 @@ def create_map_shell_domain(
 
 class ShellScriptTemplate:
 
+    # all variable names the shell actions provide, `$key` may be followed by
+    # the 1-indexed path item number
+    # the group keeps the variable names in the result of `split`
+    VARIABLE_PATTERN = re.compile(r'(\$(?:key\d*|new_value|old_value|value))')
+
     def __init__(self, script: str) -> None:
         super().__init__()
 
         self.script = script
 
+        # locate all variables once, the parts alternate between literal text
+        # (even indices) and variable names (odd indices)
+        self.parts: tuple[str, ...] = tuple(self.VARIABLE_PATTERN.split(script))
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ShellScriptTemplate):
             return False
@@ -94,14 +117,26 @@ class ShellScriptTemplate:
 
     def get_interpolated_script(
         self,
-        variables: dict[str, str],
+        variables: Mapping[str, str],
     ) -> str:
-        # perform the interpolation, replacing variable names with values
-        interpolated_script = self.script
-        for name, value in variables.items():
-            interpolated_script = interpolated_script.replace(name, value)
+        """
+        Replace variable names in the script with their values.
 
-        return interpolated_script
+        Notes:
+        - the script is not scanned again, the variables found when the
+          template was created are spliced with their values
+        - substituted values are not interpolated again
+        - unknown variable names are left as is
+        """
+
+        if len(self.parts) == 1:
+            return self.script
+
+        parts = list(self.parts)
+        for i in range(1, len(parts), 2):
+            parts[i] = variables.get(parts[i], parts[i])
+
+        return ''.join(parts)
 
     # todo: does this belong to a `ShellAction` class?
     def get_path_variables(self, path: tuple[str, ...]) -> dict[str, str]:
@@ -160,14 +195,24 @@ class ShellAddAction(DomainAction):
     def get_new_entry(self) -> ListConfigEntry | MapConfigEntry[str]:
         return self.new_entry
 
+    @cached_property
+    def interpolated_script(self) -> str:
+        """
+        The script with all variables replaced, interpolated on first use.
+        """
+
+        # layer the value variables over the path variables, no merged copy
+        variables = ChainMap(
+            {
+                '$value': self.new_entry.value,
+                '$new_value': self.new_entry.value,
+            },
+            self.script_template.get_path_variables(self.new_entry.path),
+        )
+        return self.script_template.get_interpolated_script(variables)
+
     def run(self, executor: SystemExecutor) -> None:
-        variables = {
-            **self.script_template.get_path_variables(self.new_entry.path),
-            '$value': self.new_entry.value,
-            '$new_value': self.new_entry.value,
-        }
-        script = self.script_template.get_interpolated_script(variables)
-        executor.shell(script)
+        executor.shell(self.interpolated_script)
 
 
 class ShellUpdateAction(DomainAction):
@@ -214,15 +259,24 @@ class ShellUpdateAction(DomainAction):
     def get_new_entry(self) -> ListConfigEntry | MapConfigEntry[str]:
         return self.new_entry
 
+    @cached_property
+    def interpolated_script(self) -> str:
+        """
+        The script with all variables replaced, interpolated on first use.
+        """
+
+        variables = ChainMap(
+            {
+                '$value': self.new_entry.value,
+                '$new_value': self.new_entry.value,
+                '$old_value': self.old_entry.value,
+            },
+            self.script_template.get_path_variables(self.new_entry.path),
+        )
+        return self.script_template.get_interpolated_script(variables)
+
     def run(self, executor: SystemExecutor) -> None:
-        variables = {
-            **self.script_template.get_path_variables(self.new_entry.path),
-            '$value': self.new_entry.value,
-            '$new_value': self.new_entry.value,
-            '$old_value': self.old_entry.value,
-        }
-        script = self.script_template.get_interpolated_script(variables)
-        executor.shell(script)
+        executor.shell(self.interpolated_script)
 
 
 class ShellRemoveAction(DomainAction):
@@ -266,11 +320,20 @@ class ShellRemoveAction(DomainAction):
     def get_new_entry(self) -> None:
         return None
 
+    @cached_property
+    def interpolated_script(self) -> str:
+        """
+        The script with all variables replaced, interpolated on first use.
+        """
+
+        variables = ChainMap(
+            {
+                '$value': self.old_entry.value,
+                '$old_value': self.old_entry.value,
+            },
+            self.script_template.get_path_variables(self.old_entry.path),
+        )
+        return self.script_template.get_interpolated_script(variables)
+
     def run(self, executor: SystemExecutor) -> None:
-        variables = {
-            **self.script_template.get_path_variables(self.old_entry.path),
-            '$value': self.old_entry.value,
-            '$old_value': self.old_entry.value,
-        }
-        script = self.script_template.get_interpolated_script(variables)
-        executor.shell(script)
+        executor.shell(self.interpolated_script)
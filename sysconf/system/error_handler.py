@@ -50,11 +50,14 @@ class PromptUserErrorHandler(ErrorHandler):
         self.exceptions = tuple(exceptions)
 
     def try_run(self, task: Callable[[], None]) -> ErrorHandler.Status:
+        # bind once, the except clause is evaluated on every failed attempt
+        exceptions = self.exceptions
+
         for _ in range(5):  # Limit to 5 attempts
             try:
                 task()
                 return ErrorHandler.Status.SUCCESS
-            except self.exceptions as e:
+            except exceptions as e:
                 print('An error occurred while executing the action:')
                 print(str(e))
                 print()  # Empty line
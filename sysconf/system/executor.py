@@ -1,14 +1,23 @@
 # pyright: strict
 
 import subprocess
+import sys
 from abc import ABC, abstractmethod
 
 
+# characters that need a shell to be interpreted, scripts without any of these
+# are a single command with whitespace separated arguments
+SHELL_METACHARACTERS = frozenset('|&;<>(){}[]$`\\"\'*?#~=%!\n')
+
+
 class SystemExecutor(ABC):
     """
     Abstract base class for executing system commands.
     """
 
+    # lets slotted subclasses avoid a per instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def command(self, *command: str) -> None:
         """
@@ -54,31 +63,59 @@ class LiveSystemExecutor(SystemExecutor):
 
     def shell(self, script: str) -> None:
         print('$', script)
-        process: subprocess.CompletedProcess[bytes] = subprocess.run(
-            script,
-            shell=True,
-        )
+        process: subprocess.CompletedProcess[bytes] = self.run_script(script)
         print()  # empty line
 
         if process.returncode != 0:
             raise CommandException(script, process)
 
+    def run_script(self, script: str) -> subprocess.CompletedProcess[bytes]:
+        """
+        Run a shell script, skipping the shell when it's not needed.
+
+        Notes:
+        - scripts without shell metacharacters are a single simple command and
+          are run directly, saving the extra shell process
+        - falls back to the shell if the command can't be executed directly,
+          e.g. a shell builtin like `exit` or `.`, or a file that is not
+          executable, so the shell reports the error and exit code
+        """
+
+        if SHELL_METACHARACTERS.isdisjoint(script):
+            # without quotes or escapes, the shell only splits the arguments on
+            # spaces and tabs (newlines are metacharacters), unlike str.split()
+            # which also splits on other (e.g. unicode) whitespace
+            arguments = [
+                argument
+                for argument in script.replace('\t', ' ').split(' ')
+                if argument
+            ]
+            if arguments:
+                try:
+                    return subprocess.run(arguments)
+                except OSError:
+                    pass
+
+        return subprocess.run(script, shell=True)
+
 
 class PreviewSystemExecutor(SystemExecutor):
     """
     Executor that only prints the commands instead of executing them.
+
+    Notes:
+    - each command is followed by an empty line, written in a single write
+    - output is not deferred so it stays in order with other printed output
     """
 
     def __eq__(self, value: object) -> bool:
         return isinstance(value, PreviewSystemExecutor)
 
     def command(self, *command: str) -> None:
-        print(subprocess.list2cmdline(command))
-        print()  # empty line
+        sys.stdout.write(f'{subprocess.list2cmdline(command)}\n\n')
 
     def shell(self, script: str) -> None:
-        print(script)
-        print()  # empty line
+        sys.stdout.write(f'{script}\n\n')
 
 
 class CommandException(Exception):
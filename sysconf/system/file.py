@@ -1,5 +1,7 @@
 # pyright: strict
 
+import os
+import shutil
 from pathlib import Path
 
 
@@ -14,6 +16,8 @@ class FileReader:
 
         Notes:
         - assumes file is a UTF-8 encoded text file
+        - the file is read as bytes and decoded in one go, line endings are
+          therefore not translated
 
         Args:
             path (Path): The path to the file to open, read, and close.
@@ -21,7 +25,22 @@ class FileReader:
             str: The contents of the file.
         """
 
-        with open(file=path, mode='r', encoding='utf-8') as file:
+        return self.get_file_bytes(path).decode('utf-8')
+
+    def get_file_bytes(self, path: Path) -> bytes:
+        """
+        Read the raw contents of a file and return it as bytes.
+
+        Useful for consumers that decode the content themselves, e.g. the YAML
+        parser.
+
+        Args:
+            path (Path): The path to the file to open, read, and close.
+        Returns:
+            bytes: The contents of the file.
+        """
+
+        with open(file=path, mode='rb') as file:
             return file.read()
 
 
@@ -36,16 +55,40 @@ class FileWriter:
 
         Notes:
         - assumes file is a UTF-8 encoded text file
+        - contents are written to a temporary file next to the target first,
+          which then replaces the target, so a failed write never leaves a
+          truncated file behind
+        - symlinks are resolved so the file they point to is replaced rather
+          than the link itself, and the mode of an existing file is kept
 
         Args:
             path (Path): The path to the file to open, write, and close.
             contents (str): The contents to write to the file.
         """
 
-        assert path.is_file() or not path.exists(), \
-            f'File path is not a file: {path}'
-        
-        path.parent.mkdir(parents=True, exist_ok=True)
+        target_path = Path(os.path.realpath(path))
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = target_path.with_name(target_path.name + '.tmp')
+
+        try:
+            with open(
+                file=temp_path,
+                mode='w',
+                encoding='utf-8',
+                buffering=1 << 16,
+            ) as file:
+                file.write(contents)
+
+                # make sure the contents are on disk before the rename
+                file.flush()
+                os.fsync(file.fileno())
+
+            if target_path.exists():
+                shutil.copymode(target_path, temp_path)
 
-        with open(file=path, mode='w', encoding='utf-8') as file:
-            file.write(contents)
+            # fails if the path is a directory
+            os.replace(temp_path, target_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
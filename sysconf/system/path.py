@@ -22,15 +22,19 @@ def get_validated_file_path(
 
     path = path.expanduser()
 
-    assert path.exists(), f'File {path} does not exist'
-    assert path.is_file(), f'Path {path} is not a file'
+    # a valid file needs a single stat, only check existence to tell the
+    # failure reasons apart
+    if not path.is_file():
+        assert path.exists(), f'File {path} does not exist'
+        assert False, f'Path {path} is not a file'
 
     if allowed_suffix is not None:
-        # Normalize allowed_suffix to a sequence
-        if isinstance(allowed_suffix, str):
-            allowed_suffix = (allowed_suffix,)
+        # compare a single suffix directly rather than wrapping it in a tuple
+        is_allowed = path.suffix == allowed_suffix \
+            if isinstance(allowed_suffix, str) \
+            else path.suffix in allowed_suffix
 
-        assert path.suffix in allowed_suffix, \
+        assert is_allowed, \
             f'File {path} is not a valid file type ({allowed_suffix})'
 
     return path
@@ -1,5 +1,8 @@
 # pyright: strict
 
+import sys
+from typing import cast
+
 from sysconf.config.serialization import YamlSerializable
 
 
@@ -42,26 +45,80 @@ def get_flattened_dict(
     ```
     """
 
-    flattaned_map: dict[tuple[str, ...], YamlSerializable] = {(): data}
+    # specialize the common depths of list (0) and map (1) domains
+    if path_depth <= 0:
+        return {(): data}
+    if path_depth == 1:
+        return {
+            (_intern_key(key),): value
+            for key, value in _get_children((), data).items()
+        }
 
-    # flatten first `path_depth` levels
-    for _ in range(path_depth):
+    # (keys, value) pairs of the current level, swapped for the next level's
+    # pairs on each iteration
+    flattened_items: list[tuple[tuple[str, ...], YamlSerializable]] = [
+        ((), data),
+    ]
 
-        # check this level can be flattened
-        assert all(
-            isinstance(v, dict) or v is None
-            for v in flattaned_map.values()
-        ), f'Non-dict value at intermediate level encountered: {flattaned_map}'
-
-        # flatten one level
-        flattaned_map = {
-            keys + (key,): value
-            for keys, next_map in flattaned_map.items()
-            if isinstance(next_map, dict)
-            for key, value in next_map.items()
-        }
+    # flatten all but the last of the first `path_depth` levels
+    for _ in range(path_depth - 1):
+        next_items: list[tuple[tuple[str, ...], YamlSerializable]] = []
+
+        for keys, value in flattened_items:
+            for key, next_value in _get_children(keys, value).items():
+                next_items.append((keys + (_intern_key(key),), next_value))
+
+        flattened_items = next_items
+
+    # the last level is written straight into the result rather than into
+    # another list of pairs that would then be copied into a dict
+    flattened_map: dict[tuple[str, ...], YamlSerializable] = {}
+    for keys, value in flattened_items:
+        for key, next_value in _get_children(keys, value).items():
+            flattened_map[keys + (_intern_key(key),)] = next_value
+
+    return flattened_map
+
+
+def _get_children(
+    keys: tuple[str, ...],
+    value: YamlSerializable,
+) -> dict[str, YamlSerializable]:
+    """
+    Get the mapping one level below the given intermediate value.
+
+    Notes:
+    - None values at intermediate levels are skipped (have no children)
 
-    return flattaned_map
+    Args:
+        keys: The keys leading to the value, used for error messages
+        value: The intermediate value to flatten
+    Returns:
+        The value itself if it is a dict, an empty dict if it is None.
+    """
+
+    # skip None values at intermediate levels
+    if value is None:
+        return {}
+
+    # check this level can be flattened
+    assert isinstance(value, dict), \
+        f'Non-dict value at intermediate level encountered: {keys}: {value}'
+
+    return value
+
+
+def _intern_key(key: str) -> str:
+    """
+    Intern a flattened key, section names repeat across many paths so they
+    share one object (YAML may yield non-str keys, which are kept as is).
+    """
+
+    # keys are typed as str, non-str keys only fail at runtime
+    try:
+        return sys.intern(key)
+    except TypeError:
+        return key
 
 
 class DataStructure:
@@ -94,11 +151,17 @@ class DataStructure:
     ```
     """
 
+    __slots__ = ('data', '_last_parent_path', '_last_parent')
+
     def __init__(self, data: YamlSerializable) -> None:
         super().__init__()
 
         self.data = data
 
+        # parent container of the last set value, see __setitem__
+        self._last_parent_path: tuple[str | int, ...] | None = None
+        self._last_parent: YamlSerializable = None
+
     def __getitem__(self, path: tuple[str | int, ...]) -> YamlSerializable:
 
         assert all(
@@ -113,16 +176,17 @@ class DataStructure:
             if current_node is None:
                 return None
 
-            match key:
-                case str():
-                    assert isinstance(current_node, dict)
-                    current_node = current_node.get(key, None)
-                case int():
-                    assert isinstance(current_node, list)
-                    if 0 <= key < len(current_node):
-                        current_node = current_node[key]
-                    else:
-                        current_node = None
+            # exact type checks, keys are validated to be str or int above
+            if type(key) is str:
+                assert isinstance(current_node, dict)
+                current_node = current_node.get(key, None)
+            else:
+                index = cast(int, key)
+                assert isinstance(current_node, list)
+                if 0 <= index < len(current_node):
+                    current_node = current_node[index]
+                else:
+                    current_node = None
 
         return current_node
 
@@ -139,33 +203,50 @@ class DataStructure:
 
         if path == ():
             self.data = value
+            # the cached parent belonged to the replaced data
+            self._last_parent_path = None
+            self._last_parent = None
             return
 
-        target: YamlSerializable = self.data
-        for key_current, key_next in zip(path, [*path[1:], None]):
-
-            next_default: YamlSerializable = None
-            match key_next:
-                case str():
-                    next_default = {}
-                case int():
-                    next_default = []
-                case None:
-                    next_default = value
-
-            match key_current:
-                case str():
+        leaf_index = len(path) - 1
+        parent_path = path[:leaf_index]
+
+        # consecutive sets usually share a parent (e.g. appending to the same
+        # list), reuse it rather than walking down from the root again
+        if parent_path == self._last_parent_path:
+            target = self._last_parent
+        else:
+            target = self.data
+            for index in range(leaf_index):
+                key = path[index]
+                next_default: YamlSerializable = \
+                    {} if type(path[index + 1]) is str else []
+
+                if type(key) is str:
                     assert isinstance(target, dict)
-                    if key_current not in target:
-                        target[key_current] = next_default
-                    target = target[key_current]
-                case int():
+                    target = target.setdefault(key, next_default)
+                else:
+                    key = cast(int, key)
                     assert isinstance(target, list)
-                    assert 0 <= key_current <= len(target)
-                    if key_current < len(target):
-                        target = target[key_current]
-                    else:
+                    assert 0 <= key <= len(target)
+                    if key == len(target):
                         target.append(next_default)
+                    target = target[key]
+
+            self._last_parent_path = parent_path
+            self._last_parent = target
+
+        # set the leaf value, existing values are not replaced
+        key = path[leaf_index]
+        if type(key) is str:
+            assert isinstance(target, dict)
+            target.setdefault(key, value)
+        else:
+            key = cast(int, key)
+            assert isinstance(target, list)
+            assert 0 <= key <= len(target)
+            if key == len(target):
+                target.append(value)
 
     def get_data(self) -> YamlSerializable:
         """
@@ -1,8 +1,22 @@
 # pyright: strict
 
+import functools
 from pathlib import Path
 
 
+@functools.cache
+def _get_config_dir() -> Path:
+    """
+    Resolve the configuration directory once per process.
+
+    Notes:
+    - The home directory does not change during a run, so the expanded path is
+      cached rather than expanded again on every call
+    """
+
+    return Path('~/.config/system-config-manager/').expanduser()
+
+
 class Defaults:
     """
     Provide default values for various configurable arguments
@@ -19,7 +33,7 @@ class Defaults:
         as the history of applied configurations and any data this tool needs.
         """
 
-        return Path('~/.config/system-config-manager/').expanduser()
+        return _get_config_dir()
 
     def get_old_config_path(self) -> Path:
         """
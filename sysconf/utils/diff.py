@@ -1,11 +1,36 @@
 # pyright: strict
 
-import itertools
-from typing import Any, Generic, Iterable, TypeVar, cast
+from typing import Any, Container, Generic, Iterable, TypeVar, cast
 
 T = TypeVar('T')
 
 
+def _get_lookups(
+    old_items: tuple[T, ...],
+    new_items: tuple[T, ...],
+) -> tuple[frozenset[T], frozenset[T]] | tuple[tuple[T, ...], tuple[T, ...]]:
+    """
+    Get containers for fast membership tests of the given items.
+
+    Notes:
+    - Hashable items are put into frozensets for O(1) lookups
+    - If either side has unhashable items (e.g. lists from YAML data), both
+      fall back to the tuples themselves and linear lookups, as each side is
+      probed with the items of the other
+
+    Args:
+        old_items: The old items to look up
+        new_items: The new items to look up
+    Returns:
+        A pair of containers supporting `in` tests of the old and new items.
+    """
+
+    try:
+        return frozenset(old_items), frozenset(new_items)
+    except TypeError:
+        return old_items, new_items
+
+
 class Diff(Generic[T]):
     """
     Represents the difference between two collections preserving order.
@@ -26,6 +51,17 @@ class Diff(Generic[T]):
         union: All items in `a` or `b` (without duplicates)
     """
 
+    __slots__ = (
+        'old',
+        'new',
+        'exclusive_old',
+        'exclusive_new',
+        'intersection',
+        'union',
+        '_old_lookup',
+        '_hash',
+    )
+
     def __init__(
         self,
         old: tuple[T, ...],
@@ -34,6 +70,7 @@ class Diff(Generic[T]):
         exclusive_new: tuple[T, ...],
         intersection: tuple[T, ...],
         union: tuple[T, ...],
+        old_lookup: Container[T] | None = None,
     ) -> None:
         super().__init__()
 
@@ -45,12 +82,28 @@ class Diff(Generic[T]):
         self.intersection = intersection
         self.union = union
 
+        # membership lookup of `old`, built on demand when not provided
+        self._old_lookup = old_lookup
+
+        # hash of all fields, computed on first use
+        self._hash: int | None = None
+
     def __eq__(self, value: Any) -> bool:
+        if self is value:
+            return True
+
         if not isinstance(value, Diff):
             return False
 
         _value: Diff[Any] = cast(Diff[Any], value)
 
+        # differing hashes (if already computed) mean the fields differ, so the
+        # field by field comparison can be skipped
+        if self._hash is not None \
+                and _value._hash is not None \
+                and self._hash != _value._hash:
+            return False
+
         return self.old == _value.old \
             and self.new == _value.new \
             and self.exclusive_old == _value.exclusive_old \
@@ -58,6 +111,26 @@ class Diff(Generic[T]):
             and self.intersection == _value.intersection \
             and self.union == _value.union
 
+    def __hash__(self) -> int:
+        """
+        Hash of all fields, cached as the fields are never reassigned.
+
+        Notes:
+        - Raises a TypeError if any of the items are unhashable
+        """
+
+        if self._hash is None:
+            self._hash = hash((
+                self.old,
+                self.new,
+                self.exclusive_old,
+                self.exclusive_new,
+                self.intersection,
+                self.union,
+            ))
+
+        return self._hash
+
     @classmethod
     def create_from_iterables(cls, old_items: Iterable[T], new_items: Iterable[T]) -> 'Diff[T]':
         """
@@ -74,20 +147,48 @@ class Diff(Generic[T]):
         old_items = tuple(old_items)
         new_items = tuple(new_items)
 
-        exclusive_old = tuple(
-            item for item in old_items if item not in new_items
-        )
-        exclusive_new = tuple(
-            item for item in new_items if item not in old_items
-        )
-        intersection = tuple(
-            # keep order of new_items
-            item for item in new_items if item in old_items
-        )
-        union = tuple(
-            # prefer order of new_items
-            itertools.chain(exclusive_old, new_items)
-        )
+        # build the lookups once, iterate the tuples to preserve order
+        old_lookup, new_lookup = _get_lookups(old_items, new_items)
+
+        # shortcuts for trivial cases (e.g. an unchanged config), the set
+        # comparisons run in C and skip the ordered filter passes
+        disjoint = old_in_new = new_in_old = False
+        if isinstance(old_lookup, frozenset) and isinstance(new_lookup, frozenset):
+            disjoint = old_lookup.isdisjoint(new_lookup)
+            old_in_new = not disjoint and old_lookup <= new_lookup
+            new_in_old = not disjoint and new_lookup <= old_lookup
+
+        if disjoint:
+            exclusive_old = old_items
+            exclusive_new = new_items
+            intersection = ()
+
+        elif new_in_old:
+            exclusive_old = () if old_in_new else tuple(
+                item for item in old_items if item not in new_lookup
+            )
+            exclusive_new = ()
+            intersection = new_items
+
+        else:
+            exclusive_old = () if old_in_new else tuple(
+                item for item in old_items if item not in new_lookup
+            )
+
+            # split new_items in a single pass, keeping the order of new_items
+            exclusive_new_list: list[T] = []
+            intersection_list: list[T] = []
+            for item in new_items:
+                if item in old_lookup:
+                    intersection_list.append(item)
+                else:
+                    exclusive_new_list.append(item)
+
+            exclusive_new = tuple(exclusive_new_list)
+            intersection = tuple(intersection_list)
+
+        # prefer order of new_items
+        union = exclusive_old + new_items
 
         return cls(
             old_items,
@@ -96,6 +197,45 @@ class Diff(Generic[T]):
             exclusive_new,
             intersection,
             union,
+            old_lookup,
+        )
+
+    @classmethod
+    def create_from_sets(cls, old_items: Iterable[T], new_items: Iterable[T]) -> 'Diff[T]':
+        """
+        Create a Diff object from two iterables of hashable items, without
+        preserving order.
+
+        Notes:
+        - Only for callers that do not depend on the order of items
+        - `old` and `new` keep the order of the given iterables
+        - `exclusive_old`, `exclusive_new`, `intersection` and `union` are in
+          arbitrary (set) order
+        - Items must be hashable, the set operations run in C rather than in
+          Python level loops
+
+        Args:
+            old_items: The first collection of items
+            new_items: The second collection of items
+        Returns:
+            A Diff object holding the items the two collections have in
+            common, and those they don't.
+        """
+
+        old_items = tuple(old_items)
+        new_items = tuple(new_items)
+
+        old_set = frozenset(old_items)
+        new_set = frozenset(new_items)
+
+        return cls(
+            old_items,
+            new_items,
+            tuple(old_set - new_set),
+            tuple(new_set - old_set),
+            tuple(old_set & new_set),
+            tuple(old_set | new_set),
+            old_set,
         )
 
     def get_entries(self) -> 'tuple[DiffEntry[T], ...]':
@@ -109,13 +249,18 @@ class Diff(Generic[T]):
 
         entries: list[DiffEntry[T]] = []
 
+        # reuse the lookup built while diffing rather than scanning `old`
+        if self._old_lookup is None:
+            self._old_lookup, _ = _get_lookups(self.old, self.new)
+        old_lookup = self._old_lookup
+
         # removed items
         for item in self.exclusive_old:
             entries.append(DiffEntry(old_item=item, new_item=None))
 
         # unchanged and new items in order of new
         for item in self.new:
-            if item in self.old:
+            if item in old_lookup:
                 entries.append(DiffEntry(old_item=item, new_item=item))
             else:
                 entries.append(DiffEntry(old_item=None, new_item=item))
@@ -132,6 +277,8 @@ class DiffEntry(Generic[T]):
         new_item: The new item (None if removed)
     """
 
+    __slots__ = ('old_item', 'new_item')
+
     def __init__(self, old_item: T | None, new_item: T | None) -> None:
         super().__init__()
 
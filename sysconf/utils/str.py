@@ -25,12 +25,19 @@ def unindent(text: str) -> str:
 
     lines: list[str] = text.splitlines()
 
-    # find minimum indentation (ignore empty lines)
-    min_indent: int = min(
-        (len(line) - len(line.lstrip()))
-        for line in lines
-        if line.strip()
-    )
+    # find minimum indentation (ignore empty lines) in a single pass, each
+    # line is stripped once
+    min_indent: int | None = None
+    for line in lines:
+        stripped = line.lstrip()
+        if stripped:
+            indent = len(line) - len(stripped)
+            if min_indent is None or indent < min_indent:
+                min_indent = indent
+
+    # same error as `min()` of no lines
+    if min_indent is None:
+        raise ValueError('Text must contain a non-empty line')
 
     # remove indentation
     unindented: str = '\n'.join(line[min_indent:] for line in lines)
@@ -15,7 +15,7 @@ class SequenceTransitioner(Generic[T]):
 
     Notes:
     - Only supports a monotonic transition from the old list to new (no backtracking)
-    - Items cannot be duplicated in either list
+    - Items cannot be duplicated in the new list
     - Internally this will remove or move items from the old list and move them
       or add new ones to the new list
     - The final state will have items in the order:
@@ -23,22 +23,37 @@ class SequenceTransitioner(Generic[T]):
       - then all remaining old items in their original order
     - The current state can be retrieved at any time and reflects the state of
       old items + all updates applied so far
+    - Old items may contain duplicates (e.g. the same action listed twice),
+      each update removes the first remaining occurrence
+    - Old items are kept in a list with their remaining positions indexed by
+      item, so they must be hashable, this makes removing and checking items
+      O(1) while keeping duplicates and their order
     """
 
+    __slots__ = ('old_items', 'new_items', '_old_indices', '_is_old_removed')
+
     @classmethod
     def create_from_old_items(cls, old_items: Iterable[T]) -> Self:
         """
         Create a new SequenceTransitioner from the given old items.
         """
 
-        return cls(list(old_items), [])
+        return cls(list(old_items), {})
 
-    def __init__(self, old_items: list[T], new_items: list[T]) -> None:
+    def __init__(self, old_items: list[T], new_items: dict[T, None]) -> None:
         super().__init__()
 
         self.old_items = old_items
         self.new_items = new_items
 
+        # remaining positions of each old item, last first so the first
+        # occurrence can be popped off the end
+        self._old_indices: dict[T, list[int]] = {}
+        for index in range(len(old_items) - 1, -1, -1):
+            self._old_indices.setdefault(old_items[index], []).append(index)
+
+        self._is_old_removed = [False] * len(old_items)
+
     def update_item(
         self,
         old_item: T | None,
@@ -66,20 +81,25 @@ class SequenceTransitioner(Generic[T]):
             + f'old item: {old_item}, new item: {new_item}'
 
         if old_item is not None:
-            assert old_item in self.old_items, \
+            indices = self._old_indices.get(old_item)
+            assert indices, \
                 f'Cannot remove item {old_item}, it was not found in the old items list'
 
-            self.old_items.remove(old_item)
+            self._is_old_removed[indices.pop()] = True
 
         if new_item is not None:
             assert new_item not in self.new_items, \
                 f'Cannot add item {new_item}, it already exists in the new items list'
 
-            self.new_items.append(new_item)
+            self.new_items[new_item] = None
 
     def get_current_items(self) -> tuple[T, ...]:
         """
         Get the current items after applying updates.
         """
 
-        return tuple(self.new_items) + tuple(self.old_items)
+        return tuple(self.new_items) + tuple(
+            item
+            for item, is_removed in zip(self.old_items, self._is_old_removed)
+            if not is_removed
+        )
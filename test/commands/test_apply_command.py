@@ -1,9 +1,11 @@
 # pyright: strict
 
 from argparse import ArgumentParser, Namespace
+from contextlib import redirect_stdout
 from dataclasses import dataclass
+import io
 from pathlib import Path
-from unittest.mock import call, patch, MagicMock
+from unittest.mock import patch, MagicMock
 
 from sysconf.commands.apply_command import ApplyCommand
 from sysconf.system.executor import LiveSystemExecutor, SystemExecutor
@@ -16,6 +18,13 @@ from test.test_case import TestCase
 from test.utils.mock_path import fpath
 
 
+# the datasets never modify the manager, so they all share a single instance
+_DEFAULT_MANAGER = MockSystemManager.default()
+_DEFAULT_PARSER = MockComparativeConfigCommandParser.default(
+    system_manager=_DEFAULT_MANAGER,
+)
+
+
 class TestApplyCommand(TestCase):
 
     def test_get_name(self) -> None:
@@ -71,9 +80,7 @@ class TestApplyCommand(TestCase):
 
     @datasets({
         'both paths provided': CreateFromArgumentsDataset(
-            fixture_create_from_arguments=MockComparativeConfigCommandParser.default(
-                system_manager=MockSystemManager.default(),
-            ),
+            fixture_create_from_arguments=_DEFAULT_PARSER,
             input_parsed_arguments=Namespace(
                 config_file=fpath('/manual/new.yaml'),
                 last_config=fpath('/manual/old.yaml'),
@@ -83,14 +90,12 @@ class TestApplyCommand(TestCase):
                 last_config=fpath('/manual/old.yaml'),
             ),
             expected_command=ApplyCommand(
-                manager=MockSystemManager.default(),
+                manager=_DEFAULT_MANAGER,
                 executor=LiveSystemExecutor(),
             ),
         ),
         'only new config provided': CreateFromArgumentsDataset(
-            fixture_create_from_arguments=MockComparativeConfigCommandParser.default(
-                system_manager=MockSystemManager.default(),
-            ),
+            fixture_create_from_arguments=_DEFAULT_PARSER,
             input_parsed_arguments=Namespace(
                 config_file=fpath('/manual/new.yaml'),
                 last_config=None,
@@ -100,14 +105,12 @@ class TestApplyCommand(TestCase):
                 last_config=None,
             ),
             expected_command=ApplyCommand(
-                manager=MockSystemManager.default(),
+                manager=_DEFAULT_MANAGER,
                 executor=LiveSystemExecutor(),
             ),
         ),
         'only old config provided': CreateFromArgumentsDataset(
-            fixture_create_from_arguments=MockComparativeConfigCommandParser.default(
-                system_manager=MockSystemManager.default(),
-            ),
+            fixture_create_from_arguments=_DEFAULT_PARSER,
             input_parsed_arguments=Namespace(
                 config_file=None,
                 last_config=fpath('/manual/old.yaml'),
@@ -117,14 +120,12 @@ class TestApplyCommand(TestCase):
                 last_config=fpath('/manual/old.yaml'),
             ),
             expected_command=ApplyCommand(
-                manager=MockSystemManager.default(),
+                manager=_DEFAULT_MANAGER,
                 executor=LiveSystemExecutor(),
             ),
         ),
         'no paths provided': CreateFromArgumentsDataset(
-            fixture_create_from_arguments=MockComparativeConfigCommandParser.default(
-                system_manager=MockSystemManager.default(),
-            ),
+            fixture_create_from_arguments=_DEFAULT_PARSER,
             input_parsed_arguments=Namespace(
                 config_file=None,
                 last_config=None,
@@ -134,7 +135,7 @@ class TestApplyCommand(TestCase):
                 last_config=None,
             ),
             expected_command=ApplyCommand(
-                manager=MockSystemManager.default(),
+                manager=_DEFAULT_MANAGER,
                 executor=LiveSystemExecutor(),
             ),
         ),
@@ -242,22 +243,19 @@ class TestApplyCommand(TestCase):
         )
 
         # Act
-        # Patch print
-        with patch('builtins.print') as mock_print:
+        stdout = io.StringIO()
+        with redirect_stdout(stdout):
             apply_command.run()
 
         # Assert
 
         # DomainAction.run calls
-        all(
-            isinstance(a.run, MagicMock) and
-            a.run.assert_called_once_with(dataset.expected_system_executor)
-            for a
-            in dataset.fixture_system_manager.get_actions(dataset.fixture_system_manager)
-        )
+        for action in dataset.fixture_system_manager.actions:
+            assert isinstance(action, MockDomainAction)
+            action.assert_run_once_with(dataset.expected_system_executor)
 
-        # print calls
-        mock_print.assert_has_calls(
-            [call(p) for p in dataset.expected_prints],
-            any_order=False,
+        # printed lines
+        self.assertEqual(
+            stdout.getvalue().splitlines(),
+            dataset.expected_prints,
         )
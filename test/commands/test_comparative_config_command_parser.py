@@ -2,6 +2,7 @@
 
 from argparse import ArgumentParser, Namespace
 from dataclasses import dataclass
+import functools
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -14,6 +15,37 @@ from test.utils.mock_defaults import MockDefaults
 from test.utils.mock_path import MockPath, dpath, fpath
 
 
+@functools.cache
+def _build_fixture_configs() -> dict[Path, SystemConfig]:
+    """
+    Build the configs loaded for each path, once on first use.
+
+    The same config objects are loaded by the parser under test and used for
+    the expected parser, so comparisons hit the identity fast path of
+    SystemConfig.__eq__.
+    """
+
+    return {
+        Path('/manual/old.yaml'):
+        SystemConfig({
+            'domain1': GSettingsConfig({('schema', 'key'): 'value1'}),
+        }),
+        Path('/manual/new.yaml'):
+        SystemConfig({
+            'domain1': GSettingsConfig({('schema', 'key'): 'value1'}),
+            'domain2': GSettingsConfig({('schema', 'key'): 'value2'}),
+        }),
+        Path('/default/old.yaml'):
+        SystemConfig({
+            'domain1': GSettingsConfig({('schema', 'key'): 'old'}),
+        }),
+        Path('/default/new.yaml'):
+        SystemConfig({
+            'domain2': GSettingsConfig({('schema', 'key'): 'new'}),
+        }),
+    }
+
+
 class TestComparativeConfigCommandParser(TestCase):
 
     @dataclass
@@ -65,34 +97,13 @@ class TestComparativeConfigCommandParser(TestCase):
 
     @dataclass
     class CreateFromArgumentsSuccessDataset:
-        fixture_configs: dict[Path, SystemConfig]
         fixture_defaults: MockDefaults
         input_parsed_arguments: Namespace
-        expected_parser: ComparativeConfigCommandParser
-
-    fixture_configs = {
-        Path('/manual/old.yaml'):
-        SystemConfig({
-            'domain1': GSettingsConfig({('schema', 'key'): 'value1'}),
-        }),
-        Path('/manual/new.yaml'):
-        SystemConfig({
-            'domain1': GSettingsConfig({('schema', 'key'): 'value1'}),
-            'domain2': GSettingsConfig({('schema', 'key'): 'value2'}),
-        }),
-        Path('/default/old.yaml'):
-        SystemConfig({
-            'domain1': GSettingsConfig({('schema', 'key'): 'old'}),
-        }),
-        Path('/default/new.yaml'):
-        SystemConfig({
-            'domain2': GSettingsConfig({('schema', 'key'): 'new'}),
-        }),
-    }
+        expected_old_config_path: Path
+        expected_new_config_path: Path
 
     @datasets({
         'both paths provided': CreateFromArgumentsSuccessDataset(
-            fixture_configs=fixture_configs,
             fixture_defaults=MockDefaults(
                 old_config_path=fpath('/default/old.yaml'),
                 new_config_path=fpath('/default/new.yaml'),
@@ -101,15 +112,10 @@ class TestComparativeConfigCommandParser(TestCase):
                 config_file=fpath('/manual/new.yaml'),
                 last_config=fpath('/manual/old.yaml'),
             ),
-            expected_parser=ComparativeConfigCommandParser(
-                SystemManager(
-                    old_config=fixture_configs[fpath('/manual/old.yaml')],
-                    new_config=fixture_configs[fpath('/manual/new.yaml')],
-                )
-            ),
+            expected_old_config_path=Path('/manual/old.yaml'),
+            expected_new_config_path=Path('/manual/new.yaml'),
         ),
         'only new config provided, uses default old path': CreateFromArgumentsSuccessDataset(
-            fixture_configs=fixture_configs,
             fixture_defaults=MockDefaults(
                 old_config_path=fpath('/default/old.yaml'),
                 new_config_path=fpath('/default/new.yaml'),
@@ -118,15 +124,10 @@ class TestComparativeConfigCommandParser(TestCase):
                 config_file=fpath('/manual/new.yaml'),
                 last_config=None
             ),
-            expected_parser=ComparativeConfigCommandParser(
-                SystemManager(
-                    old_config=fixture_configs[fpath('/default/old.yaml')],
-                    new_config=fixture_configs[fpath('/manual/new.yaml')],
-                )
-            ),
+            expected_old_config_path=Path('/default/old.yaml'),
+            expected_new_config_path=Path('/manual/new.yaml'),
         ),
         'only old config provided, uses default new path': CreateFromArgumentsSuccessDataset(
-            fixture_configs=fixture_configs,
             fixture_defaults=MockDefaults(
                 old_config_path=fpath('/default/old.yaml'),
                 new_config_path=fpath('/default/new.yaml'),
@@ -135,15 +136,10 @@ class TestComparativeConfigCommandParser(TestCase):
                 config_file=None,
                 last_config=fpath('/manual/old.yaml'),
             ),
-            expected_parser=ComparativeConfigCommandParser(
-                SystemManager(
-                    old_config=fixture_configs[fpath('/manual/old.yaml')],
-                    new_config=fixture_configs[fpath('/default/new.yaml')],
-                )
-            ),
+            expected_old_config_path=Path('/manual/old.yaml'),
+            expected_new_config_path=Path('/default/new.yaml'),
         ),
         'no paths provided, uses defaults': CreateFromArgumentsSuccessDataset(
-            fixture_configs=fixture_configs,
             fixture_defaults=MockDefaults(
                 old_config_path=fpath('/default/old.yaml'),
                 new_config_path=fpath('/default/new.yaml'),
@@ -152,12 +148,8 @@ class TestComparativeConfigCommandParser(TestCase):
                 config_file=None,
                 last_config=None
             ),
-            expected_parser=ComparativeConfigCommandParser(
-                SystemManager(
-                    old_config=fixture_configs[fpath('/default/old.yaml')],
-                    new_config=fixture_configs[fpath('/default/new.yaml')],
-                ),
-            ),
+            expected_old_config_path=Path('/default/old.yaml'),
+            expected_new_config_path=Path('/default/new.yaml'),
         ),
     })
     @patch('sysconf.commands.comparative_config_command_parser.load_config_from_file')
@@ -171,11 +163,12 @@ class TestComparativeConfigCommandParser(TestCase):
         """Test successful creation from arguments with various input combinations."""
 
         # Arrange
+        fixture_configs = _build_fixture_configs()
         mock_defaults_class.return_value = dataset.fixture_defaults
 
         def mock_load_config_side_effect(file_reader: object, path: Path) -> SystemConfig:
             # Find the matching MockPath in fixture_configs by comparing the path string
-            config = dataset.fixture_configs.get(path)
+            config = fixture_configs.get(path)
             if config is not None:
                 return config
             raise FileNotFoundError(f"No config found for path {path}")
@@ -188,8 +181,14 @@ class TestComparativeConfigCommandParser(TestCase):
         )
 
         # Assert
+        expected_parser = ComparativeConfigCommandParser(
+            SystemManager(
+                old_config=fixture_configs[dataset.expected_old_config_path],
+                new_config=fixture_configs[dataset.expected_new_config_path],
+            ),
+        )
         self.assertIsInstance(actual, ComparativeConfigCommandParser)
-        self.assertEqual(actual, dataset.expected_parser)
+        self.assertEqual(actual, expected_parser)
 
     @dataclass
     class CreateFromArgumentsErrorDataset:
@@ -197,12 +196,14 @@ class TestComparativeConfigCommandParser(TestCase):
         input_parsed_arguments: Namespace
         expected_exception_message: str
 
+    # patched once for all datasets, see `datasets`
+    @patch('sysconf.commands.comparative_config_command_parser.Defaults')
     @datasets({
         'old default config file not found': CreateFromArgumentsErrorDataset(
             fixture_defaults=MockDefaults(
                 old_config_path=MockPath(
                     '/default/old.yaml',
-                    is_file=True,
+                    is_file=False,
                     exists=False,
                 ),
                 new_config_path=fpath('/default/new.yaml'),
@@ -218,7 +219,7 @@ class TestComparativeConfigCommandParser(TestCase):
                 old_config_path=fpath('/default/old.yaml'),
                 new_config_path=MockPath(
                     '/default/new.yaml',
-                    is_file=True,
+                    is_file=False,
                     exists=False,
                 ),
             ),
@@ -236,7 +237,7 @@ class TestComparativeConfigCommandParser(TestCase):
             input_parsed_arguments=Namespace(
                 config_file=MockPath(
                     'nonexistent.yaml',
-                    is_file=True,
+                    is_file=False,
                     exists=False,
                 ),
                 last_config=None
@@ -252,7 +253,7 @@ class TestComparativeConfigCommandParser(TestCase):
                 config_file=fpath('test.yaml'),
                 last_config=MockPath(
                     'nonexistent.yaml',
-                    is_file=True,
+                    is_file=False,
                     exists=False,
                 ),
             ),
@@ -281,7 +282,6 @@ class TestComparativeConfigCommandParser(TestCase):
             expected_exception_message='not a file',
         ),
     })
-    @patch('sysconf.commands.comparative_config_command_parser.Defaults')
     def test_create_from_arguments_error(
         self,
         dataset: CreateFromArgumentsErrorDataset,
@@ -1,8 +1,9 @@
 # pyright: strict
 
 from argparse import ArgumentParser, Namespace
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 from unittest.mock import call, patch, MagicMock
 
 from sysconf.commands.preview_command import PreviewCommand
@@ -169,6 +170,14 @@ class TestPreviewCommand(TestCase):
         fixture_system_executor: SystemExecutor
         expected_system_executor: SystemExecutor
         expected_prints: list[str]
+        # calls built with `call(...)`, whose type is private to unittest.mock
+        expected_print_calls: list[Any] = field(init=False)
+
+        def __post_init__(self) -> None:
+            # built once per dataset rather than on every run
+            self.expected_print_calls = [
+                call(p) for p in self.expected_prints
+            ]
 
     @datasets({
         'no changes required': RunDataset(
@@ -249,15 +258,12 @@ class TestPreviewCommand(TestCase):
         # Assert
 
         # DomainAction.run calls
-        all(
-            isinstance(a.run, MagicMock) and
-            a.run.assert_called_once_with(dataset.expected_system_executor)
-            for a
-            in dataset.fixture_system_manager.get_actions(dataset.fixture_system_manager)
-        )
+        for action in dataset.fixture_system_manager.actions:
+            assert isinstance(action, MockDomainAction)
+            action.assert_run_once_with(dataset.expected_system_executor)
 
         # print calls
         mock_print.assert_has_calls(
-            [call(p) for p in dataset.expected_prints],
+            dataset.expected_print_calls,
             any_order=False,
         )
@@ -1,18 +1,50 @@
 # pyright: strict
 
-from functools import wraps
-from typing import Callable, TypeVar
+from typing import Any, Callable, TypeVar
 from unittest import TestCase
 
 D = TypeVar('D')
 S = TypeVar('S', bound=TestCase)
 
 
+def _copy_test_attributes(
+    wrapper: Callable[..., None],
+    wrapped: Callable[..., None],
+) -> Callable[..., None]:
+    """
+    Lighter `functools.wraps`, only copies what unittest reads from a test
+    method.
+
+    Notes:
+    - `__doc__` is kept as unittest uses it for the test's short description
+    - Attributes are optional, mocks used as test methods have no `__name__`
+    """
+
+    for attribute in ('__name__', '__qualname__', '__doc__'):
+        try:
+            setattr(wrapper, attribute, getattr(wrapped, attribute))
+        except AttributeError:
+            pass
+
+    setattr(wrapper, '__wrapped__', wrapped)
+    return wrapper
+
+
+def _no_dataset_fixture(self: Any, dataset: Any) -> None:
+    """
+    Default dataset setUp/tearDown, recognized by identity so the wrappers can
+    skip calling it.
+    """
+
+
 def datasets(
     datasets: dict[str, D],
-    setUpDataset: Callable[[S, D], None] = lambda self, dataset: None,
-    tearDownDataset: Callable[[S, D], None] = lambda self, dataset: None
-) -> Callable[[Callable[[S, D], None]], Callable[[S], None]]:
+    setUpDataset: Callable[[S, D], None] = _no_dataset_fixture,
+    tearDownDataset: Callable[[S, D], None] = _no_dataset_fixture,
+    shared_setup: bool = False,
+    setUpAll: Callable[[S], None] = lambda self: None,
+    tearDownAll: Callable[[S], None] = lambda self: None,
+) -> Callable[[Callable[..., None]], Callable[..., None]]:
     """
     A decorator factory that allows running a test method with multiple datasets.
     It uses the `subTest` context manager to create subtests for each dataset,
@@ -22,6 +54,9 @@ def datasets(
         datasets (dict[str, T]): A dictionary containing the datasets to be used for testing.
         setUpDataset (Callable): A method to be called before running the test method for each dataset.
         tearDownDataset (Callable): A method to be called after running the test method for each dataset.
+        shared_setup (bool): Run `setUpAll` and `tearDownAll` once around all datasets instead of the per dataset methods, which may then not be given.
+        setUpAll (Callable): A method to be called once before the first dataset, if `shared_setup` is set.
+        tearDownAll (Callable): A method to be called once after the last dataset, if `shared_setup` is set.
 
     Returns:
         Callable: The decorated test method.
@@ -30,9 +65,40 @@ def datasets(
         @datasets({'dataset1': [1, 2, 3], 'dataset2': [4, 5, 6]})
         def test_method(self, dataset: list[int]):
             # Test implementation
+
+    Notes:
+    - Extra arguments passed to the decorated method are passed on after the
+      dataset, so decorators like `@patch` placed above `@datasets` are
+      entered once for all datasets rather than once per dataset
+    - With `shared_setup` the fixtures set up by `setUpAll` are shared by all
+      datasets, so neither the test method nor the datasets may mutate them
     """
 
-    def decorator(test_method: Callable[[S, D], None]) -> Callable[[S], None]:
+    if shared_setup and (
+        setUpDataset is not _no_dataset_fixture
+        or tearDownDataset is not _no_dataset_fixture
+    ):
+        raise ValueError(
+            'setUpDataset and tearDownDataset cannot be used with shared_setup, '
+            + 'use setUpAll and tearDownAll instead'
+        )
+
+    def _with_shared_setup(wrapper: Callable[..., None]) -> Callable[..., None]:
+        """
+        Wrap a dataset wrapper to run `setUpAll` once before and `tearDownAll`
+        once after all datasets.
+        """
+
+        def shared_wrapper_test(self: S, *args: Any) -> None:
+            setUpAll(self)
+            try:
+                wrapper(self, *args)
+            finally:
+                tearDownAll(self)
+
+        return _copy_test_attributes(shared_wrapper_test, wrapper)
+
+    def decorator(test_method: Callable[..., None]) -> Callable[..., None]:
         """
         A decorator function that wraps a test method and runs it for each dataset in the 'datasets' dictionary.
 
@@ -44,8 +110,41 @@ def datasets(
 
         """
 
-        @wraps(test_method)
-        def wrapper_test(self: S) -> None:
+        # resolved once at decoration time rather than on every run
+        items = tuple(datasets.items())
+
+        # only set up and tear down datasets if needed, most tests don't
+        run_dataset: Callable[..., None]
+        if setUpDataset is _no_dataset_fixture \
+                and tearDownDataset is _no_dataset_fixture:
+            run_dataset = test_method
+
+        elif tearDownDataset is _no_dataset_fixture:
+            def run_dataset_with_set_up(
+                self: S,
+                dataset: D,
+                *args: Any,
+            ) -> None:
+                setUpDataset(self, dataset)
+                test_method(self, dataset, *args)
+
+            run_dataset = run_dataset_with_set_up
+
+        else:
+            def run_dataset_with_fixtures(
+                self: S,
+                dataset: D,
+                *args: Any,
+            ) -> None:
+                setUpDataset(self, dataset)
+                try:
+                    test_method(self, dataset, *args)
+                finally:
+                    tearDownDataset(self, dataset)
+
+            run_dataset = run_dataset_with_fixtures
+
+        def wrapper_test(self: S, *args: Any) -> None:
             """
             A wrapper method for testing datasets.
 
@@ -54,19 +153,20 @@ def datasets(
 
             Parameters:
             - self: The instance of the test class.
+            - args: Extra arguments (e.g. mocks) passed on to the test method.
 
             Returns:
             - None
             """
 
-            for name, dataset in datasets.items():
-                with self.subTest(name=name):
-                    setUpDataset(self, dataset)
-                    try:
-                        test_method(self, dataset)
-                    finally:
-                        tearDownDataset(self, dataset)
+            sub_test = self.subTest
+            for name, dataset in items:
+                with sub_test(name=name):
+                    run_dataset(self, dataset, *args)
 
-        return wrapper_test
+        _copy_test_attributes(wrapper_test, test_method)
+        return _with_shared_setup(wrapper_test) \
+            if shared_setup \
+            else wrapper_test
 
     return decorator
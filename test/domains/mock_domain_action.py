@@ -1,26 +1,48 @@
 # pyright: strict
 
-from unittest.mock import MagicMock
 from sysconf.config.domains import DomainAction
 from sysconf.system.executor import SystemExecutor
 
 
 class MockDomainAction(DomainAction):
+    """
+    Mock domain action with a fixed description that records its runs.
+
+    Plain methods are used rather than MagicMocks, actions are created in
+    large numbers across datasets.
+    """
+
+    __slots__ = ('description', 'run_calls')
 
     def __init__(self, description: str) -> None:
         self.description = description
 
-        self.get_description = MagicMock(return_value=description)
-        self.run = MagicMock()
+        # executors passed to `run`, in order
+        self.run_calls: list[SystemExecutor] = []
 
     def __eq__(self, value: object) -> bool:
-        if not isinstance(value, MockDomainAction):
+        if type(value) is not MockDomainAction:
             return False
         
         return self.description == value.description
     
-    def get_description(self) -> str: # pyright: ignore
-        pass
+    def get_description(self) -> str:
+        return self.description
+
+    def get_old_entry(self) -> None:
+        return None
+
+    def get_new_entry(self) -> None:
+        return None
 
     def run(self, executor: SystemExecutor) -> None:
-        pass
+        self.run_calls.append(executor)
+
+    def assert_run_once_with(self, executor: SystemExecutor) -> None:
+        """
+        Assert `run` was called exactly once, with the given executor.
+        """
+
+        assert self.run_calls == [executor], \
+            f'Expected run to be called once with {executor}, ' \
+            + f'calls: {self.run_calls}'
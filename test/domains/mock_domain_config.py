@@ -9,11 +9,13 @@ T = TypeVar('T', infer_variance=True)
 
 class MockDomainConfig(DomainConfig):
 
+    __slots__ = ('data',)
+
     def __init__(self, data: YamlSerializable) -> None:
         self.data = data
 
     def __eq__(self, value: object) -> bool:
-        if not isinstance(value, MockDomainConfig):
+        if type(value) is not MockDomainConfig:
             return False
         
         return self.data == value.data
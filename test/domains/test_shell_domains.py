@@ -0,0 +1,69 @@
+# pyright: strict
+
+from dataclasses import dataclass
+
+from sysconf.domains.shell_domains import ShellScriptTemplate
+from test.datasets import datasets
+from test.test_case import TestCase
+
+
+class TestShellScriptTemplate(TestCase):
+    """Tests for the ShellScriptTemplate class."""
+
+    @dataclass
+    class InterpolatedScriptDataset:
+        input_script: str
+        input_variables: dict[str, str]
+        expected_script: str
+
+    @datasets({
+        'no variables': InterpolatedScriptDataset(
+            input_script='sudo apt update',
+            input_variables={'$value': 'vim'},
+            expected_script='sudo apt update',
+        ),
+        'value': InterpolatedScriptDataset(
+            input_script='sudo apt install -y $value',
+            input_variables={'$value': 'vim'},
+            expected_script='sudo apt install -y vim',
+        ),
+        'repeated variables': InterpolatedScriptDataset(
+            input_script='rm -f $key; ln -sf $value $key;',
+            input_variables={'$key': '/a', '$key1': '/a', '$value': '/b'},
+            expected_script='rm -f /a; ln -sf /b /a;',
+        ),
+        'numbered keys': InterpolatedScriptDataset(
+            input_script='gsettings set $key1 $key2 "$new_value"',
+            input_variables={
+                '$key': 'org.schema',
+                '$key1': 'org.schema',
+                '$key2': 'key',
+                '$new_value': 'value',
+            },
+            expected_script='gsettings set org.schema key "value"',
+        ),
+        'unknown variables are kept': InterpolatedScriptDataset(
+            input_script='echo $old_value $HOME',
+            input_variables={'$value': 'vim'},
+            expected_script='echo $old_value $HOME',
+        ),
+        'values are not interpolated again': InterpolatedScriptDataset(
+            input_script='echo $key $value',
+            input_variables={'$key': '$value', '$value': 'vim'},
+            expected_script='echo $value vim',
+        ),
+        'shell parameter expansion is kept': InterpolatedScriptDataset(
+            input_script='value="$value"; sudo snap remove ${value%% *};',
+            input_variables={'$value': 'code --classic'},
+            expected_script='value="code --classic"; sudo snap remove ${value%% *};',
+        ),
+    })
+    def test_get_interpolated_script(self, dataset: InterpolatedScriptDataset):
+        # Arrange
+        template = ShellScriptTemplate(dataset.input_script)
+
+        # Act
+        actual = template.get_interpolated_script(dataset.input_variables)
+
+        # Assert
+        self.assertEqual(actual, dataset.expected_script)
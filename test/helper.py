@@ -1,6 +1,9 @@
 # pyright: strict
 
+import functools
 
+
+@functools.cache
 def unindent(text: str) -> str:
     """
     Convenience function to unindent multi-line strings in tests.
@@ -12,6 +15,9 @@ def unindent(text: str) -> str:
     Also removes the leading and trailing newlines characters so the \"\"\" can
     be on their own lines.
 
+    Results are cached, datasets often unindent the same string literals
+    (e.g. fixture files repeated between cases).
+
     Example:
     ```python
         unindent(\"\"\"
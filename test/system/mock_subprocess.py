@@ -1,13 +1,15 @@
 # pyright: strict
 
 from subprocess import CompletedProcess
-from unittest.mock import MagicMock
+
+from test.utils.mock_callable import MockCallable
+
 
 def create_mock_run(
         return_complete_process: CompletedProcess[bytes] \
             | dict[tuple[str, ...], CompletedProcess[bytes]] \
             | None = None,
-) -> MagicMock:
+) -> MockCallable[CompletedProcess[bytes]]:
         """
         Creates a mock for subprocess.run which returns configured
         fake CompletedProcess instances without actually running any commands.
@@ -25,10 +27,8 @@ def create_mock_run(
             def get_side_effect(command: tuple[str, ...]) -> CompletedProcess[bytes]:
                 return return_complete_process[command]
 
-            return MagicMock(
-                side_effect=get_side_effect
-            )
+            return MockCallable(side_effect=get_side_effect)
 
         # single return value case
         else:
-            return MagicMock(return_value=return_complete_process)
+            return MockCallable(return_value=return_complete_process)
@@ -1,16 +1,43 @@
 # pyright: strict
 
-from unittest.mock import MagicMock
 from sysconf.system.executor import SystemExecutor
 
 
 class MockSystemExecutor (SystemExecutor):
+    """
+    Mock system executor that records the commands it is asked to run.
+
+    A plain list is used rather than a MagicMock, executors are created for
+    every dataset.
+    """
+
+    __slots__ = ('calls',)
 
     def __init__(self) -> None:
-        self.exec = MagicMock(return_value=None)
+        # commands passed to `exec`, in order
+        self.calls: list[tuple[str, ...]] = []
 
     def __eq__(self, value: object) -> bool:
-        return isinstance(value, MockSystemExecutor)
+        return type(value) is MockSystemExecutor
 
     def exec(self, *command: str) -> None:
-        pass
\ No newline at end of file
+        self.calls.append(command)
+
+    def command(self, *command: str) -> None:
+        self.exec(*command)
+
+    def shell(self, script: str) -> None:
+        self.exec(script)
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    def assert_called_with(self, *command: str) -> None:
+        """
+        Assert the last command run was the given command.
+        """
+
+        assert self.calls, f'Expected command: {command}, nothing was run'
+        assert self.calls[-1] == command, \
+            f'Expected command: {command}, actual: {self.calls[-1]}'
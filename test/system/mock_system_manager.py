@@ -1,11 +1,9 @@
 
 # pyright: strict
 
-from typing import Callable, Iterable, Sequence
-from unittest.mock import MagicMock
+from typing import Sequence
 from sysconf.config.domains import DomainAction
 from sysconf.config.system_config import SystemConfig, SystemManager
-from test.domains.mock_domain_action import MockDomainAction
 from test.system.mock_system_config import MockSystemConfig
 
 
@@ -18,11 +16,14 @@ class MockSystemManager (SystemManager):
         get_actions: Sequence[DomainAction] | None = None,
     ) -> None:
         super().__init__(old_config=old_config, new_config=new_config)
-        get_actions = get_actions or []
 
-        self.get_actions: (  # type: ignore
-            MagicMock | Callable[[SystemManager], Iterable[MockDomainAction]]
-        ) = MagicMock(return_value=get_actions)
+        # immutable, so the same tuple is returned on every call
+        self.actions: tuple[DomainAction, ...] = tuple(get_actions or ())
+        self.get_actions_call_count = 0
+
+    def get_actions(self) -> tuple[DomainAction, ...]:
+        self.get_actions_call_count += 1
+        return self.actions
 
     @classmethod
     def default(
@@ -34,6 +35,5 @@ class MockSystemManager (SystemManager):
 
         old_config = old_config or MockSystemConfig.default()
         new_config = new_config or MockSystemConfig.default()
-        get_actions = get_actions or []
 
         return cls(old_config=old_config, new_config=new_config, get_actions=get_actions)
@@ -0,0 +1,124 @@
+# pyright: strict
+
+import io
+from dataclasses import dataclass
+from subprocess import CompletedProcess
+from typing import Any
+from unittest.mock import MagicMock, call, patch
+
+from sysconf.system.executor import CommandException, LiveSystemExecutor
+from test.datasets import datasets
+from test.system.mock_subprocess import create_mock_run
+from test.test_case import TestCase
+
+
+class TestLiveSystemExecutor(TestCase):
+
+    @dataclass
+    class ShellDataset:
+        input_script: str
+        expected_run_call: Any
+
+    @datasets({
+        'simple command is run directly': ShellDataset(
+            input_script='sudo apt install -y vim',
+            expected_run_call=call(['sudo', 'apt', 'install', '-y', 'vim']),
+        ),
+        'extra whitespace': ShellDataset(
+            input_script='  code   --install-extension ms-python.python ',
+            expected_run_call=call(
+                ['code', '--install-extension', 'ms-python.python'],
+            ),
+        ),
+        'only spaces and tabs separate arguments': ShellDataset(
+            input_script='printf\ta\xa0b\r',
+            expected_run_call=call(['printf', 'a\xa0b\r']),
+        ),
+        'quotes need a shell': ShellDataset(
+            input_script='sudo groupadd "docker"',
+            expected_run_call=call('sudo groupadd "docker"', shell=True),
+        ),
+        'variables need a shell': ShellDataset(
+            input_script='echo $HOME',
+            expected_run_call=call('echo $HOME', shell=True),
+        ),
+        'multiple commands need a shell': ShellDataset(
+            input_script='sudo apt update;\nsudo apt upgrade -y',
+            expected_run_call=call(
+                'sudo apt update;\nsudo apt upgrade -y',
+                shell=True,
+            ),
+        ),
+        'empty script': ShellDataset(
+            input_script='',
+            expected_run_call=call('', shell=True),
+        ),
+    })
+    def test_shell(self, dataset: ShellDataset) -> None:
+        # Arrange
+        mock_run = create_mock_run()
+        executor = LiveSystemExecutor()
+
+        # Act
+        with patch('subprocess.run', mock_run), \
+                patch('sys.stdout', io.StringIO()):
+            executor.shell(dataset.input_script)
+
+        # Assert
+        self.assertEqual(mock_run.call_args_list, [dataset.expected_run_call])
+
+    def test_shell_builtin_falls_back_to_shell(self) -> None:
+        # Arrange
+        mock_run = MagicMock(side_effect=[
+            FileNotFoundError(),
+            CompletedProcess(args=(), returncode=0),
+        ])
+        executor = LiveSystemExecutor()
+
+        # Act
+        with patch('subprocess.run', mock_run), \
+                patch('sys.stdout', io.StringIO()):
+            executor.shell('exit 0')
+
+        # Assert
+        self.assertEqual(mock_run.call_args_list, [
+            call(['exit', '0']),
+            call('exit 0', shell=True),
+        ])
+
+    @datasets({
+        'shell builtin': FileNotFoundError(),
+        'not executable': PermissionError(),
+    })
+    def test_shell_unexecutable_command_falls_back_to_shell(
+        self,
+        dataset: OSError,
+    ) -> None:
+        # Arrange
+        mock_run = MagicMock(side_effect=[
+            dataset,
+            CompletedProcess(args=(), returncode=0),
+        ])
+        executor = LiveSystemExecutor()
+
+        # Act
+        with patch('subprocess.run', mock_run), \
+                patch('sys.stdout', io.StringIO()):
+            executor.shell('. /etc/os-release')
+
+        # Assert
+        self.assertEqual(mock_run.call_args_list, [
+            call(['.', '/etc/os-release']),
+            call('. /etc/os-release', shell=True),
+        ])
+
+    def test_shell_failure(self) -> None:
+        # Arrange
+        mock_run = create_mock_run(CompletedProcess(args=(), returncode=1))
+        executor = LiveSystemExecutor()
+
+        # Act & Assert
+        with patch('subprocess.run', mock_run), \
+                patch('sys.stdout', io.StringIO()), \
+                self.assertRaises(CommandException):
+            executor.shell('false')
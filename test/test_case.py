@@ -1,12 +1,56 @@
 # pyright: strict
 
+from typing import Any
 from unittest import TestCase as _TestCase
 
+from sysconf.utils.diff import Diff
+
 
 class TestCase(_TestCase):
     """
-    Project wide base test case class, this should be used instead of 
+    Project wide base test case class, this should be used instead of
     unittest.TestCase
     """
 
     maxDiff = None
+
+    def __init__(self, methodName: str = 'runTest') -> None:
+        super().__init__(methodName)
+
+        self.addTypeEqualityFunc(Diff, self.assertDiffEqual)
+
+    def assertDiffEqual(
+        self,
+        first: Diff[Any],
+        second: Diff[Any],
+        msg: Any = None,
+    ) -> None:
+        """
+        Assert two Diffs are equal, used by `assertEqual` for Diffs.
+
+        Notes:
+        - Compares with `Diff.__eq__` directly and only inspects the fields to
+          list the ones that differ if they're not equal
+        """
+
+        if first == second:
+            return
+
+        fields = (
+            'old',
+            'new',
+            'exclusive_old',
+            'exclusive_new',
+            'intersection',
+            'union',
+        )
+        differences = [
+            f'{field}: {getattr(first, field)!r} != {getattr(second, field)!r}'
+            for field in fields
+            if getattr(first, field) != getattr(second, field)
+        ]
+
+        self.fail(self._formatMessage(
+            msg,
+            'Diffs differ:\n' + '\n'.join(differences),
+        ))
@@ -58,6 +58,25 @@ class DatasetTest(TestCase):
         self.assertEqual(mock_test_method.call_count, 2)
         self.assertEqual(mock_subtest.call_count, 2)
 
+    def test_single_dataset(self):
+        # Arrange
+        data = {'dataset1': [1, 2, 3]}
+        decorator: Callable[
+            [Callable[[Self, list[int]], None]],
+            Callable[[Self], None]
+        ] = datasets(data)
+
+        mock_test_method = mock.MagicMock()
+        wrapped_test_method = decorator(mock_test_method)
+
+        # Act
+        with mock.patch.object(self, 'subTest') as mock_subtest:
+            wrapped_test_method(self)
+
+        # Assert
+        mock_test_method.assert_called_once_with(self, [1, 2, 3])
+        mock_subtest.assert_called_once_with(name='dataset1')
+
     def test_test_name(self):
         # Arrange
         data = {'dataset1': [1, 2, 3], 'dataset2': [4, 5, 6]}
@@ -100,6 +119,28 @@ class DatasetTest(TestCase):
             mock.call(self, [4, 5, 6]),
         ])
 
+    def test_extra_arguments(self):
+        # Arrange
+        data = {'dataset1': [1, 2, 3], 'dataset2': [4, 5, 6]}
+        decorator: Callable[
+            [Callable[..., None]],
+            Callable[..., None]
+        ] = datasets(data)
+
+        mock_test_method = mock.MagicMock()
+        wrapped_test_method = decorator(mock_test_method)
+        extra_argument = object()
+
+        # Act
+        with mock.patch.object(self, 'subTest'):
+            wrapped_test_method(self, extra_argument)
+
+        # Assert
+        mock_test_method.assert_has_calls([
+            mock.call(self, [1, 2, 3], extra_argument),
+            mock.call(self, [4, 5, 6], extra_argument),
+        ])
+
     def test_failed_dataset_test(self):
         # Arrange
         data = {'dataset1': [1, 2, 3], 'dataset2': [4, 5, 6]}
@@ -190,3 +231,57 @@ class DatasetTest(TestCase):
                 ('tearDownDataset', self, [4, 5, 6]),
             ],
         )
+
+    def test_shared_setup(self):
+        # Arrange
+        data = {'dataset1': [1, 2, 3], 'dataset2': [4, 5, 6]}
+        calls: list[tuple[str, ...] | tuple[str, list[int]]] = []
+
+        def setUpAll(self: Self):
+            calls.append(('setUpAll',))
+
+        def tearDownAll(self: Self):
+            calls.append(('tearDownAll',))
+
+        def testMethod(self: Self, dataset: list[int]):
+            calls.append(('testMethod', dataset))
+
+        decorator: Callable[
+            [Callable[[Self, list[int]], None]],
+            Callable[[Self], None]
+        ] = datasets(
+            data,
+            shared_setup=True,
+            setUpAll=setUpAll,
+            tearDownAll=tearDownAll,
+        )
+        wrapped_test_method = decorator(testMethod)
+
+        # Act
+        with mock.patch.object(self, 'subTest'):
+            wrapped_test_method(self)
+
+        # Assert
+        self.assertEqual(
+            calls,
+            [
+                ('setUpAll',),
+                ('testMethod', [1, 2, 3]),
+                ('testMethod', [4, 5, 6]),
+                ('tearDownAll',),
+            ],
+        )
+
+    def test_shared_setup_with_dataset_fixtures(self):
+        # Arrange
+        data = {'dataset1': [1, 2, 3], 'dataset2': [4, 5, 6]}
+
+        def setUpDataset(self: Self, dataset: list[int]):
+            pass
+
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            datasets(data, setUpDataset=setUpDataset, shared_setup=True)
+
+        with self.assertRaises(ValueError):
+            datasets(data, tearDownDataset=setUpDataset, shared_setup=True)
@@ -0,0 +1,47 @@
+# pyright: strict
+
+from unittest.mock import call
+
+from test.utils.mock_callable import MockCallable
+from test.test_case import TestCase
+
+
+class MockCallableTest(TestCase):
+
+    def test_call_records_and_returns(self):
+        # Arrange
+        mock_callable = MockCallable[int](side_effect=lambda x: x * 2)  # type: ignore
+
+        # Act
+        actual = mock_callable(2)
+
+        # Assert
+        self.assertEqual(actual, 4)
+        self.assertEqual(mock_callable.call_args_list, [call(2)])
+        mock_callable.assert_called_once_with(2)
+
+    def test_return_value(self):
+        # Arrange
+        mock_callable = MockCallable(return_value='value')
+
+        # Act
+        actual = mock_callable('a', key=1)
+
+        # Assert
+        self.assertEqual(actual, 'value')
+        mock_callable.assert_called_with('a', key=1)
+
+    def test_assert_has_calls(self):
+        # Arrange
+        mock_callable = MockCallable[None]()
+
+        # Act
+        mock_callable(1)
+        mock_callable(2)
+        mock_callable(3)
+
+        # Assert
+        self.assertEqual(mock_callable.call_count, 3)
+        mock_callable.assert_has_calls([call(2), call(3)])
+        with self.assertRaises(AssertionError):
+            mock_callable.assert_has_calls([call(1), call(3)])
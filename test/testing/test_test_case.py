@@ -0,0 +1,29 @@
+# pyright: strict
+
+from sysconf.utils.diff import Diff
+from test.test_case import TestCase
+
+
+class TestCaseTest(TestCase):
+
+    def test_assert_equal_diffs(self):
+        # Arrange
+        diff1 = Diff[str].create_from_iterables(['a', 'b'], ['b', 'c'])
+        diff2 = Diff[str].create_from_iterables(['a', 'b'], ['b', 'c'])
+
+        # Act & Assert
+        self.assertEqual(diff1, diff2)
+
+    def test_assert_equal_different_diffs(self):
+        # Arrange
+        diff1 = Diff[str].create_from_iterables(['a', 'b'], ['b', 'c'])
+        diff2 = Diff[str].create_from_iterables(['a', 'b'], ['b', 'd'])
+
+        # Act
+        with self.assertRaises(AssertionError) as context:
+            self.assertEqual(diff1, diff2)
+
+        # Assert
+        message = str(context.exception)
+        self.assertIn("new: ('b', 'c') != ('b', 'd')", message)
+        self.assertNotIn('\nold:', message)
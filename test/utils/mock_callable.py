@@ -0,0 +1,86 @@
+# pyright: strict
+
+from typing import Any, Callable, Generic, Sequence, TypeVar
+from unittest.mock import _Call, call  # type: ignore
+
+
+R = TypeVar('R')
+
+
+class MockCallable(Generic[R]):
+    """
+    Lightweight replacement for `MagicMock(side_effect=...)` and
+    `MagicMock(return_value=...)` that only records its calls.
+
+    Notes:
+    - Much cheaper to create and call than a MagicMock, use it for mocks that
+      are called often and only need their calls asserted
+    - Records calls as `unittest.mock.call` objects so `call_args_list` can be
+      compared with the same expected values as a MagicMock's
+    - If a side effect is given, its result is returned, otherwise the return
+      value is returned
+
+    Example:
+    ```python
+        mock_run = MockCallable(return_value=CompletedProcess((), 0))
+        mock_run(('ls', '-l'))
+        mock_run.assert_called_once_with(('ls', '-l'))
+    ```
+    """
+
+    __slots__ = ('side_effect', 'return_value', 'call_args_list')
+
+    def __init__(
+        self,
+        side_effect: Callable[..., R] | None = None,
+        return_value: R | None = None,
+    ) -> None:
+        self.side_effect = side_effect
+        self.return_value = return_value
+        self.call_args_list: list[_Call] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R | None:
+        self.call_args_list.append(call(*args, **kwargs))
+
+        if self.side_effect is not None:
+            return self.side_effect(*args, **kwargs)
+
+        return self.return_value
+
+    @property
+    def call_count(self) -> int:
+        return len(self.call_args_list)
+
+    def assert_called_with(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Assert the last call was made with the given arguments.
+        """
+
+        expected = call(*args, **kwargs)
+        assert self.call_args_list, \
+            f'Expected call: {expected}, not called'
+        assert self.call_args_list[-1] == expected, \
+            f'Expected call: {expected}, actual: {self.call_args_list[-1]}'
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Assert exactly one call was made, with the given arguments.
+        """
+
+        assert self.call_count == 1, \
+            f'Expected 1 call, called {self.call_count} times'
+        self.assert_called_with(*args, **kwargs)
+
+    def assert_has_calls(self, calls: Sequence[_Call]) -> None:
+        """
+        Assert the given calls were made consecutively and in order, like
+        `MagicMock.assert_has_calls` (without `any_order`).
+        """
+
+        calls = list(calls)
+        size = len(calls)
+
+        assert any(
+            self.call_args_list[index:index + size] == calls
+            for index in range(len(self.call_args_list) - size + 1)
+        ), f'Calls not found: {calls}, actual: {self.call_args_list}'
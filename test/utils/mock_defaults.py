@@ -5,19 +5,31 @@ from sysconf.utils.defaults import Defaults
 from test.utils.mock_path import MockPath
 
 
+# default paths, shared by all MockDefaults instances
+_DEFAULT_CONFIG_DIR = MockPath('/config/')
+_DEFAULT_OLD_CONFIG_PATH = MockPath('/default/old.yaml')
+_DEFAULT_NEW_CONFIG_PATH = MockPath('/default/new.yaml')
+
+
 class MockDefaults(Defaults):
 
     def __init__(
         self,
-        config_dir: MockPath = MockPath('/config/'),
-        old_config_path: MockPath = MockPath('/default/old.yaml'),
-        new_config_path: MockPath = MockPath('/default/new.yaml'),
+        config_dir: MockPath | None = None,
+        old_config_path: MockPath | None = None,
+        new_config_path: MockPath | None = None,
     ) -> None:
         super().__init__()
 
-        self._config_dir = config_dir
-        self._old_config_path = old_config_path
-        self._new_config_path = new_config_path
+        self._config_dir = config_dir \
+            if config_dir is not None \
+            else _DEFAULT_CONFIG_DIR
+        self._old_config_path = old_config_path \
+            if old_config_path is not None \
+            else _DEFAULT_OLD_CONFIG_PATH
+        self._new_config_path = new_config_path \
+            if new_config_path is not None \
+            else _DEFAULT_NEW_CONFIG_PATH
 
     def get_config_dir(self) -> MockPath:
         return self._config_dir
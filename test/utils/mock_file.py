@@ -1,9 +1,20 @@
 # pyright: strict
 
+import functools
 from pathlib import Path
 from typing import Self
-from unittest.mock import MagicMock
 from sysconf.utils.file import FileReader
+from test.utils.mock_callable import MockCallable
+
+
+@functools.lru_cache(maxsize=256)
+def _get_normalized_path(path: str | Path) -> str:
+    """
+    Normalize a path for lookups, cached as the same few paths are read
+    repeatedly across datasets.
+    """
+
+    return Path(path).expanduser().resolve().as_posix()
 
 
 class MockFileReader (FileReader):
@@ -15,20 +26,42 @@ class MockFileReader (FileReader):
 
     def __init__(self, files: dict[str, str]) -> None:
         # normalize paths
-        files = {
+        self._files = {
             self._get_normalized_path(path): content
             for path, content 
             in files.items()
         }
 
-        # side effect function
-        def get_file_contents(path: Path) -> str:
-            return files[self._get_normalized_path(path)]
+        # encode once rather than on every read
+        self._files_bytes = {
+            path: content.encode('utf-8')
+            for path, content
+            in self._files.items()
+        }
+
+        self.get_file_contents = MockCallable(side_effect=self._get_file_contents)
+        self.get_file_bytes = MockCallable(side_effect=self._get_file_bytes)
+
+    def _get_file_contents(self, path: Path) -> str:
+        return self._files[self._get_key(path)]
+
+    def _get_file_bytes(self, path: Path) -> bytes:
+        return self._files_bytes[self._get_key(path)]
+
+    def _get_key(self, path: str | Path) -> str:
+        """
+        Get the key of a path in the files, only normalizing it if it isn't
+        already a key (e.g. relative or containing `~`).
+        """
+
+        key = str(path)
+        if key in self._files:
+            return key
 
-        self.get_file_contents = MagicMock(side_effect=get_file_contents)
+        return self._get_normalized_path(path)
 
     def _get_normalized_path(self, path: str | Path) -> str:
-        return Path(path).expanduser().resolve().as_posix()
+        return _get_normalized_path(path)
 
     def __call__(self) -> Self:
         """
@@ -1,5 +1,6 @@
 # pyright: strict
 
+import functools
 from pathlib import Path
 
 
@@ -8,6 +9,17 @@ class MockPath(Path):
 
     HOME_DIR = Path.home()
 
+    # Path itself is slotted, so MockPath instances carry no __dict__
+    __slots__ = (
+        '_path',
+        '_is_file',
+        '_is_dir',
+        '_is_symlink',
+        '_exists',
+        '_expanded_path',
+        '_expanded_cache',
+    )
+
     def __init__(  # pyright: ignore[reportInconsistentConstructor]
         self,
         path: str,
@@ -26,6 +38,8 @@ class MockPath(Path):
         self._is_symlink = is_symlink or 'l' in flags
         self._exists = exists or 'e' in flags
         self._expanded_path = expanded_path or path
+        # the expanded MockPath, created on first use (fields never change)
+        self._expanded_cache: MockPath | None = None
 
     def is_file(self, *, follow_symlinks: bool = True) -> bool:
         return self._is_file
@@ -40,8 +54,11 @@ class MockPath(Path):
         return self._exists
 
     def expanduser(self) -> 'MockPath':
+        if self._expanded_cache is not None:
+            return self._expanded_cache
+
         # Return a new MockPath with the pre-defined expanded path
-        return MockPath(
+        self._expanded_cache = MockPath(
             path=self._expanded_path,
             is_file=self._is_file,
             is_dir=self._is_dir,
@@ -49,11 +66,15 @@ class MockPath(Path):
             exists=self._exists,
             expanded_path=self._expanded_path,
         )
+        return self._expanded_cache
 
+# MockPaths are never modified, so identical paths share a single instance
+@functools.cache
 def fpath(path: str) -> MockPath:
     """Convenience function to create a MockPath for an existing file."""
     return MockPath(path, is_file=True, exists=True)
 
+@functools.cache
 def dpath(path: str) -> MockPath:
     """Convenience function to create a MockPath for an existing directory."""
     return MockPath(path, is_dir=True, exists=True)
\ No newline at end of file
@@ -0,0 +1,147 @@
+# pyright: strict
+
+from dataclasses import dataclass
+
+from sysconf.config.serialization import YamlSerializable
+from sysconf.utils.data import DataStructure, get_flattened_dict
+from test.datasets import datasets
+from test.test_case import TestCase
+
+
+class TestGetFlattenedDict(TestCase):
+    """Tests for the get_flattened_dict function."""
+
+    @dataclass
+    class FlattenedDictDataset:
+        input_data: YamlSerializable
+        input_path_depth: int
+        expected: dict[tuple[str, ...], YamlSerializable]
+
+    @datasets({
+        'depth 0': FlattenedDictDataset(
+            input_data={'a': 1},
+            input_path_depth=0,
+            expected={(): {'a': 1}},
+        ),
+        'depth 1': FlattenedDictDataset(
+            input_data={'a': 1, 'b': [2]},
+            input_path_depth=1,
+            expected={('a',): 1, ('b',): [2]},
+        ),
+        'None at depth 1': FlattenedDictDataset(
+            input_data=None,
+            input_path_depth=1,
+            expected={},
+        ),
+        'depth 2': FlattenedDictDataset(
+            input_data={'a': {'b': 1, 'c': {'d': 2}}, 'e': {'f': 3}},
+            input_path_depth=2,
+            expected={('a', 'b'): 1, ('a', 'c'): {'d': 2}, ('e', 'f'): 3},
+        ),
+        'None at intermediate level is skipped': FlattenedDictDataset(
+            input_data={'a': None, 'b': {'c': 1}},
+            input_path_depth=2,
+            expected={('b', 'c'): 1},
+        ),
+        'None at last level is kept': FlattenedDictDataset(
+            input_data={'a': {'b': None}},
+            input_path_depth=2,
+            expected={('a', 'b'): None},
+        ),
+    })
+    def test_get_flattened_dict(self, dataset: FlattenedDictDataset):
+        # Act
+        actual = get_flattened_dict(dataset.input_data, dataset.input_path_depth)
+
+        # Assert
+        self.assertEqual(actual, dataset.expected)
+
+    def test_get_flattened_dict_non_dict_intermediate_value(self):
+        # Act & Assert
+        with self.assertRaises(AssertionError):
+            get_flattened_dict({'a': 1}, 2)
+
+
+class TestDataStructure(TestCase):
+    """Tests for the DataStructure utility class."""
+
+    @dataclass
+    class GetItemDataset:
+        input_path: tuple[str | int, ...]
+        expected: YamlSerializable
+
+    @datasets({
+        'root': GetItemDataset(
+            input_path=(),
+            expected={'a': {'b': ['x', 'y']}},
+        ),
+        'dict and list keys': GetItemDataset(
+            input_path=('a', 'b', 1),
+            expected='y',
+        ),
+        'missing key': GetItemDataset(
+            input_path=('a', 'c', 0),
+            expected=None,
+        ),
+        'index out of range': GetItemDataset(
+            input_path=('a', 'b', 2),
+            expected=None,
+        ),
+    })
+    def test_getitem(self, dataset: GetItemDataset):
+        # Arrange
+        data = DataStructure({'a': {'b': ['x', 'y']}})
+
+        # Act
+        actual = data[dataset.input_path]
+
+        # Assert
+        self.assertEqual(actual, dataset.expected)
+
+    @dataclass
+    class SetItemDataset:
+        input_data: YamlSerializable
+        input_items: list[tuple[tuple[str | int, ...], YamlSerializable]]
+        expected_data: YamlSerializable
+
+    @datasets({
+        'set root': SetItemDataset(
+            input_data=None,
+            input_items=[((), [])],
+            expected_data=[],
+        ),
+        'nested dicts and lists': SetItemDataset(
+            input_data={},
+            input_items=[
+                (('a', 'b', 0), 'value1'),
+                (('a', 'b', 1), 'value2'),
+                (('a', 'c'), 'value3'),
+            ],
+            expected_data={'a': {'b': ['value1', 'value2'], 'c': 'value3'}},
+        ),
+        'dicts appended to a list': SetItemDataset(
+            input_data=[],
+            input_items=[((0, 'a'), 1), ((0, 'b'), 2), ((1, 'a'), 3)],
+            expected_data=[{'a': 1, 'b': 2}, {'a': 3}],
+        ),
+        'existing values are not replaced': SetItemDataset(
+            input_data={'a': {'b': 1}},
+            input_items=[(('a', 'b'), 2), (('a', 'c'), 3)],
+            expected_data={'a': {'b': 1, 'c': 3}},
+        ),
+        'root replaced between sets': SetItemDataset(
+            input_data={},
+            input_items=[(('a', 'b'), 1), ((), {}), (('a', 'c'), 2)],
+            expected_data={'a': {'c': 2}},
+        ),
+    })
+    def test_setitem(self, dataset: SetItemDataset):
+        # Arrange
+        data = DataStructure(dataset.input_data)
+
+        # Act
+        for path, value in dataset.input_items:
+            data[path] = value
+
+        # Assert
+        self.assertEqual(data.get_data(), dataset.expected_data)
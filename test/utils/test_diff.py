@@ -185,6 +185,54 @@ class TestDiff(TestCase):
                 union=(1, 2, 3, 4, 5),
             ),
         ),
+        'unhashable items': DiffDataset(
+            input_old_items=[['a'], ['b'], ['c']],
+            input_new_items=[['c'], ['b'], ['d']],
+            expected_diff=Diff(
+                old=(['a'], ['b'], ['c']),
+                new=(['c'], ['b'], ['d']),
+                exclusive_old=(['a'],),
+                exclusive_new=(['d'],),
+                intersection=(['c'], ['b']),  # order from b
+                union=(['a'], ['c'], ['b'], ['d']),  # exclusive_a + b
+            ),
+        ),
+        'empty a, unhashable b': DiffDataset(
+            input_old_items=[],
+            input_new_items=[['a']],
+            expected_diff=Diff(
+                old=(),
+                new=(['a'],),
+                exclusive_old=(),
+                exclusive_new=(['a'],),
+                intersection=(),
+                union=(['a'],),
+            ),
+        ),
+        'unhashable a, empty b': DiffDataset(
+            input_old_items=[['a']],
+            input_new_items=[],
+            expected_diff=Diff(
+                old=(['a'],),
+                new=(),
+                exclusive_old=(['a'],),
+                exclusive_new=(),
+                intersection=(),
+                union=(['a'],),
+            ),
+        ),
+        'hashable a, partly unhashable b': DiffDataset(
+            input_old_items=['a', 'b'],
+            input_new_items=['b', ['c']],
+            expected_diff=Diff(
+                old=('a', 'b'),
+                new=('b', ['c']),
+                exclusive_old=('a',),
+                exclusive_new=(['c'],),
+                intersection=('b',),
+                union=('a', 'b', ['c']),
+            ),
+        ),
     })
     def test_create_from_iterables(self, dataset: DiffDataset):
         # Arrange (no setup required)
@@ -198,6 +246,67 @@ class TestDiff(TestCase):
         # Assert
         self.assertEqual(actual, dataset.expected_diff)
 
+    def test_create_from_iterables_generators(self):
+        # Arrange
+        # generators can only be iterated once
+        old_items = (item for item in ['a', 'b'])
+        new_items = (item for item in ['b', 'c'])
+
+        # Act
+        actual = Diff[str].create_from_iterables(old_items, new_items)
+
+        # Assert
+        self.assertEqual(actual, Diff(
+            old=('a', 'b'),
+            new=('b', 'c'),
+            exclusive_old=('a',),
+            exclusive_new=('c',),
+            intersection=('b',),
+            union=('a', 'b', 'c'),
+        ))
+
+    @dataclass
+    class SetDiffDataset:
+        input_old_items: Sequence[Any]
+        input_new_items: Sequence[Any]
+        expected_exclusive_old: set[Any]
+        expected_exclusive_new: set[Any]
+        expected_intersection: set[Any]
+        expected_union: set[Any]
+
+    @datasets({
+        'empty lists': SetDiffDataset(
+            input_old_items=[],
+            input_new_items=[],
+            expected_exclusive_old=set(),
+            expected_exclusive_new=set(),
+            expected_intersection=set(),
+            expected_union=set(),
+        ),
+        'partial overlap': SetDiffDataset(
+            input_old_items=['a', 'b', 'c', 'd'],
+            input_new_items=['c', 'd', 'e', 'f'],
+            expected_exclusive_old={'a', 'b'},
+            expected_exclusive_new={'e', 'f'},
+            expected_intersection={'c', 'd'},
+            expected_union={'a', 'b', 'c', 'd', 'e', 'f'},
+        ),
+    })
+    def test_create_from_sets(self, dataset: SetDiffDataset):
+        # Act
+        actual = Diff[Any].create_from_sets(
+            dataset.input_old_items,
+            dataset.input_new_items,
+        )
+
+        # Assert
+        self.assertEqual(actual.old, tuple(dataset.input_old_items))
+        self.assertEqual(actual.new, tuple(dataset.input_new_items))
+        self.assertCountEqual(actual.exclusive_old, dataset.expected_exclusive_old)
+        self.assertCountEqual(actual.exclusive_new, dataset.expected_exclusive_new)
+        self.assertCountEqual(actual.intersection, dataset.expected_intersection)
+        self.assertCountEqual(actual.union, dataset.expected_union)
+
     @dataclass
     class EqDataset:
         diff1: Diff[Any]
@@ -428,3 +537,75 @@ class TestDiff(TestCase):
 
         # Assert
         self.assertEqual(actual, dataset.expected_equal)
+
+    def test_hash(self):
+        # Arrange
+        diff1 = Diff[str].create_from_iterables(['a', 'b'], ['b', 'c'])
+        diff2 = Diff[str].create_from_iterables(['a', 'b'], ['b', 'c'])
+        diff3 = Diff[str].create_from_iterables(['a', 'b'], ['c', 'b'])
+
+        # Act
+        actual = {diff1, diff2, diff3}
+
+        # Assert
+        self.assertEqual(hash(diff1), hash(diff2))
+        self.assertEqual(len(actual), 2)
+        self.assertNotEqual(diff1, diff3)
+
+    @dataclass
+    class GetEntriesDataset:
+        input_diff: Diff[Any]
+        expected_entries: tuple[tuple[Any, Any], ...]
+
+    @datasets({
+        'created from iterables': GetEntriesDataset(
+            input_diff=Diff[Any].create_from_iterables(
+                ['a', 'b', 'c'],
+                ['c', 'd', 'b'],
+            ),
+            expected_entries=(
+                ('a', None),
+                ('c', 'c'),
+                (None, 'd'),
+                ('b', 'b'),
+            ),
+        ),
+        'created without a lookup': GetEntriesDataset(
+            input_diff=Diff(
+                old=('a', 'b'),
+                new=('b', 'c'),
+                exclusive_old=('a',),
+                exclusive_new=('c',),
+                intersection=('b',),
+                union=('a', 'b', 'c'),
+            ),
+            expected_entries=(
+                ('a', None),
+                ('b', 'b'),
+                (None, 'c'),
+            ),
+        ),
+        'created without a lookup, unhashable new item': GetEntriesDataset(
+            input_diff=Diff(
+                old=('a',),
+                new=('a', ['b']),
+                exclusive_old=(),
+                exclusive_new=(['b'],),
+                intersection=('a',),
+                union=('a', ['b']),
+            ),
+            expected_entries=(
+                ('a', 'a'),
+                (None, ['b']),
+            ),
+        ),
+    })
+    def test_get_entries(self, dataset: GetEntriesDataset):
+        # Act
+        actual = dataset.input_diff.get_entries()
+
+        # Assert
+        self.assertEqual(
+            tuple((entry.old_item, entry.new_item) for entry in actual),
+            dataset.expected_entries,
+        )
@@ -0,0 +1,42 @@
+# pyright: strict
+
+from dataclasses import dataclass
+
+from sysconf.utils.str import unindent
+from test.datasets import datasets
+from test.test_case import TestCase
+
+
+class TestUnindent(TestCase):
+    """Tests for the unindent utility function."""
+
+    @dataclass
+    class UnindentDataset:
+        input_text: str
+        expected_text: str
+
+    @datasets({
+        'indented lines': UnindentDataset(
+            input_text='\n    line 1\n        line 2\n    line 3\n    ',
+            expected_text='line 1\n    line 2\nline 3',
+        ),
+        'empty lines are ignored': UnindentDataset(
+            input_text='\n    line 1\n\n    line 2\n    ',
+            expected_text='line 1\n\nline 2',
+        ),
+    })
+    def test_unindent(self, dataset: UnindentDataset):
+        # Act
+        actual = unindent(dataset.input_text)
+
+        # Assert
+        self.assertEqual(actual, dataset.expected_text)
+
+    @datasets({
+        'empty text': '',
+        'only whitespace': '\n    \n',
+    })
+    def test_unindent_without_content(self, dataset: str):
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            unindent(dataset)
@@ -0,0 +1,87 @@
+# pyright: strict
+
+from dataclasses import dataclass
+
+from sysconf.utils.transition import SequenceTransitioner
+from test.datasets import datasets
+from test.test_case import TestCase
+
+
+class TestSequenceTransitioner(TestCase):
+    """Tests for the SequenceTransitioner utility class."""
+
+    @dataclass
+    class UpdateItemDataset:
+        input_old_items: list[str]
+        input_updates: list[tuple[str | None, str | None]]
+        expected_items: tuple[str, ...]
+
+    @datasets({
+        'no updates': UpdateItemDataset(
+            input_old_items=['a', 'b'],
+            input_updates=[],
+            expected_items=('a', 'b'),
+        ),
+        'added item goes first': UpdateItemDataset(
+            input_old_items=['a', 'b'],
+            input_updates=[(None, 'c')],
+            expected_items=('c', 'a', 'b'),
+        ),
+        'updated item is moved': UpdateItemDataset(
+            input_old_items=['a', 'b', 'c'],
+            input_updates=[('b', 'x')],
+            expected_items=('x', 'a', 'c'),
+        ),
+        'removed item': UpdateItemDataset(
+            input_old_items=['a', 'b', 'c'],
+            input_updates=[('b', None)],
+            expected_items=('a', 'c'),
+        ),
+        'duplicate old items are removed one at a time': UpdateItemDataset(
+            input_old_items=['a', 'b', 'a'],
+            input_updates=[('a', None)],
+            expected_items=('b', 'a'),
+        ),
+        'all duplicate old items removed': UpdateItemDataset(
+            input_old_items=['a', 'b', 'a'],
+            input_updates=[('a', None), ('a', 'a')],
+            expected_items=('a', 'b'),
+        ),
+        'full transition': UpdateItemDataset(
+            input_old_items=['a', 'b', 'c'],
+            input_updates=[('a', None), ('c', 'c'), (None, 'd'), ('b', 'b')],
+            expected_items=('c', 'd', 'b'),
+        ),
+    })
+    def test_update_item(self, dataset: UpdateItemDataset):
+        # Arrange
+        transitioner = SequenceTransitioner[str].create_from_old_items(
+            dataset.input_old_items,
+        )
+
+        # Act
+        for old_item, new_item in dataset.input_updates:
+            transitioner.update_item(old_item, new_item)
+
+        # Assert
+        self.assertEqual(
+            transitioner.get_current_items(),
+            dataset.expected_items,
+        )
+
+    def test_update_item_missing_old_item(self):
+        # Arrange
+        transitioner = SequenceTransitioner[str].create_from_old_items(['a'])
+
+        # Act & Assert
+        with self.assertRaises(AssertionError):
+            transitioner.update_item('b', None)
+
+    def test_update_item_duplicate_new_item(self):
+        # Arrange
+        transitioner = SequenceTransitioner[str].create_from_old_items(['a'])
+        transitioner.update_item(None, 'b')
+
+        # Act & Assert
+        with self.assertRaises(AssertionError):
+            transitioner.update_item(None, 'b')